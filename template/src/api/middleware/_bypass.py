@@ -0,0 +1,23 @@
+"""Paths that skip the custom middlewares (probes, metrics and API docs)."""
+
+from starlette.types import Scope
+
+BYPASS_PATHS: frozenset[str] = frozenset(
+    {
+        "/health",
+        "/status",
+        "/metrics",
+        "/livez",
+        "/readyz",
+        # FastAPI's default documentation routes
+        "/docs",
+        "/docs/oauth2-redirect",
+        "/redoc",
+        "/openapi.json",
+    }
+)
+
+
+def is_bypass(scope: Scope) -> bool:
+    """Check if the request path is exempt from middleware processing."""
+    return scope["path"] in BYPASS_PATHS
@@ -1,34 +1,65 @@
 """Correlation ID middleware for request tracing."""
 
-import uuid
-from contextvars import ContextVar
+import os
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from infra.logging import logger
+from infra.logging import correlation_id_var
 
-# Context variable for correlation ID
-correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
+from ._bypass import is_bypass
 
+_CID_HEADER = b"x-correlation-id"
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    """Middleware to add correlation ID to requests."""
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+def _find_header(headers: list[tuple[bytes, bytes]], name: bytes) -> bytes | None:
+    """Find a raw header value; name must be lowercase, as in the ASGI scope."""
+    for key, value in headers:
+        if key == name:
+            return value
+    return None
+
+
+class CorrelationIdMiddleware:
+    """Pure ASGI middleware to add correlation ID to requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add correlation ID."""
+        if scope["type"] != "http" or is_bypass(scope):
+            return await self.app(scope, receive, send)
+
         # Get or generate correlation ID
-        correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+        cid_bytes = _find_header(scope["headers"], _CID_HEADER)
+        if cid_bytes:
+            correlation_id = cid_bytes.decode("latin-1")
+        else:
+            # Opaque 32-char hex id, same entropy as a UUID4 without the formatting
+            correlation_id = os.urandom(16).hex()
+            cid_bytes = correlation_id.encode("ascii")
 
-        # Set in context for logging
-        correlation_id_var.set(correlation_id)
+        cid_header = (_CID_HEADER, cid_bytes)
 
-        # Add correlation_id to the logging context for the duration of the request
-        with logger.contextualize(correlation_id=correlation_id):
-            # Process request
-            response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            # Add to response headers in place; Starlette sends a mutable list
+            if message["type"] == "http.response.start":
+                headers = message.get("headers")
+                if headers is None:
+                    message["headers"] = [cid_header]
+                elif isinstance(headers, list):
+                    headers.append(cid_header)
+                else:
+                    message["headers"] = [*headers, cid_header]
+            await send(message)
 
-            # Add to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
+        # Also expose it as request.state.correlation_id: sync (def) handlers
+        # run in a threadpool and must not rely on contextvar propagation
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
 
-            return response
+        # Set in context for logging; the log patcher reads it per record
+        token = correlation_id_var.set(correlation_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            correlation_id_var.reset(token)
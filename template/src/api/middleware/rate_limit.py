@@ -1,54 +1,118 @@
 """Rate limiting middleware using Redis."""
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import time
+from collections import OrderedDict
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from infra.cache import RateLimiter
+from infra.cache import RedisManager
 from infra.logging import logger
 from config import get_settings
 
-settings = get_settings()
+from ._bypass import is_bypass
 
-limiter = Limiter(
-    key_func=get_remote_address,
-    application_limits=settings.rate_limiter.rate,
-    enabled=settings.rate_limiter.enabled,
-)
+# Hot path settings, snapshotted by reload_settings() so requests never walk
+# the settings model
+_RL_ENABLED: bool
+_RL_LIMIT: int
+_RL_WINDOW_MS: int
+_RL_SYNC_EVERY: int
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware."""
+def reload_settings() -> None:
+    """
+    Re-read the rate limiter settings used on the hot path.
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process request with rate limiting."""
+    Call after get_settings.cache_clear() to pick up new configuration.
+    """
+    global _RL_ENABLED, _RL_LIMIT, _RL_WINDOW_MS, _RL_SYNC_EVERY
+
+    rate_limiter = get_settings().rate_limiter
+    _RL_ENABLED = rate_limiter.enabled
+    _RL_LIMIT = rate_limiter.limit
+    _RL_WINDOW_MS = rate_limiter.window_ms
+    # Each process may admit up to ~10% of the limit per client before syncing
+    _RL_SYNC_EVERY = max(1, _RL_LIMIT // 10)
+    _local_hits.clear()
+
+
+# Per-process client state: [hits not yet sent to Redis, blocked until (ms)].
+# Hits are flushed to Redis in batches, and a client Redis reports as over the
+# limit is rejected locally until its window ends. Kept in LRU order: at
+# capacity only the least recently seen client is forgotten, so new clients
+# cannot flush the block state of active ones.
+_RL_MAX_CLIENTS = 10_000
+_local_hits: OrderedDict[str, list[int]] = OrderedDict()
+
+reload_settings()
 
-        if not settings.rate_limiter.enabled:
-            return await call_next(request)
+# 429 response, written straight to the wire
+_RL_BODY = b'{"detail":"Rate limit exceeded. Please try again later."}'
+_RL_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_RL_BODY)).encode()),
+]
+
+
+class RateLimitMiddleware:
+    """Pure ASGI rate limiting middleware."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with rate limiting."""
+        if scope["type"] != "http" or is_bypass(scope) or not _RL_ENABLED:
+            return await self.app(scope, receive, send)
 
         # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/metrics"]:
-            return await call_next(request)
+        state = _local_hits.get(client_ip)
+        if state is None:
+            if len(_local_hits) >= _RL_MAX_CLIENTS:
+                _local_hits.popitem(last=False)
+            state = _local_hits[client_ip] = [0, 0]
+        else:
+            _local_hits.move_to_end(client_ip)
 
-        # Check rate limit
-        is_allowed = await RateLimiter.check_rate_limit(
-            key=client_ip,
-            limit=settings.rate_limiter.rate,
-            window=60,
-        )
+        # Check rate limit, going to Redis only once per batch of hits
+        now_ms = int(time.time() * 1000)
+        if state[1] > now_ms:
+            is_allowed, reset_ms = False, state[1] - now_ms
+        else:
+            state[0] += 1
+            is_allowed = True
+            if state[0] >= _RL_SYNC_EVERY:
+                hits, state[0] = state[0], 0
+                try:
+                    is_allowed, reset_ms = await RedisManager.check_rate_limit(
+                        key=client_ip,
+                        limit=_RL_LIMIT,
+                        window_ms=_RL_WINDOW_MS,
+                        hits=hits,
+                    )
+                except Exception as e:
+                    # Fail open: a Redis outage must not turn API traffic into 500s
+                    logger.error("rate_limit_check_failed", error=str(e))
+                else:
+                    if not is_allowed:
+                        state[1] = now_ms + reset_ms
 
         if not is_allowed:
             logger.warning("rate_limit_exceeded", client_ip=client_ip)
-            return JSONResponse(
-                status_code=429,
-                content={"detail": "Rate limit exceeded. Please try again later."},
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        *_RL_HEADERS,
+                        (b"retry-after", str(max(1, -(-reset_ms // 1000))).encode()),
+                    ],
+                }
             )
+            await send({"type": "http.response.body", "body": _RL_BODY})
+            return
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
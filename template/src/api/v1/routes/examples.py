@@ -1,5 +1,6 @@
 """Example API routes."""
 
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
@@ -11,11 +12,13 @@ from application.dto.example_dto import (
 )
 from application.use_cases.example_use_cases import (
     CreateExampleUseCase,
+    DeleteExampleUseCase,
     GetExampleUseCase,
     ListExamplesUseCase,
 )
 from api.v1.dependencies import (
     get_create_example_use_case,
+    get_delete_example_use_case,
     get_get_example_use_case,
     get_list_examples_use_case,
 )
@@ -61,6 +64,23 @@ async def get_example(
     return result
 
 
+@router.delete(
+    "/{example_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete example by ID",
+)
+async def delete_example(
+    example_id: UUID,
+    use_case: DeleteExampleUseCase = Depends(get_delete_example_use_case),
+) -> None:
+    """Delete an example by ID."""
+    if not await use_case.execute(example_id):
+        raise ResourceNotFoundException(
+            status=status.HTTP_404_NOT_FOUND,
+            message=f"Example with id {example_id} not found",
+        )
+
+
 @router.get(
     "/",
     response_model=list[ExampleDTO],
@@ -69,7 +89,18 @@ async def get_example(
 async def list_examples(
     skip: int = 0,
     limit: int = 100,
+    cursor: datetime | None = None,
+    cursor_id: UUID | None = None,
     use_case: ListExamplesUseCase = Depends(get_list_examples_use_case),
 ) -> list[ExampleDTO]:
-    """List examples with pagination."""
-    return await use_case.execute(skip=skip, limit=limit)
+    """List examples newest first; pass the last created_at and id to page."""
+    if (cursor is None) != (cursor_id is None):
+        raise ValidationException(
+            status=status.HTTP_400_BAD_REQUEST,
+            message="cursor and cursor_id must be given together",
+        )
+    return await use_case.execute(
+        skip=skip,
+        limit=limit,
+        cursor=(cursor, cursor_id) if cursor and cursor_id else None,
+    )
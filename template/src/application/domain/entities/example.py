@@ -5,7 +5,12 @@ from datetime import datetime, UTC
 from uuid import UUID, uuid4
 
 
-@dataclass
+def _now() -> datetime:
+    """Current UTC time."""
+    return datetime.now(UTC)
+
+
+@dataclass(slots=True)
 class ExampleEntity:
     """Example domain entity."""
 
@@ -13,23 +18,30 @@ class ExampleEntity:
     name: str = ""
     email: str = ""
     is_active: bool = True
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        """Default updated_at to created_at instead of reading the clock twice."""
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
+    # Mutations accept `now` so batch callers can read the clock once for many entities
 
-    def activate(self) -> None:
+    def activate(self, now: datetime | None = None) -> None:
         """Activate the entity."""
         self.is_active = True
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now or _now()
 
-    def deactivate(self) -> None:
+    def deactivate(self, now: datetime | None = None) -> None:
         """Deactivate the entity."""
         self.is_active = False
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now or _now()
 
-    def update_name(self, name: str) -> None:
+    def update_name(self, name: str, now: datetime | None = None) -> None:
         """Update entity name."""
         if not name or not name.strip():
             raise ValueError("Name cannot be empty")
 
         self.name = name.strip()
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now or _now()
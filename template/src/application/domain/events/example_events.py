@@ -1,68 +1,42 @@
 """Domain events for event-driven architecture."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
+from typing import Any
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainEvent:
     """Base domain event."""
 
-    event_id: UUID
-    timestamp: datetime
-    event_type: str
+    event_id: UUID = field(default_factory=uuid4, kw_only=True)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC), kw_only=True)
+    event_type: str = field(default="", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExampleCreatedEvent(DomainEvent):
     """Event emitted when an example is created."""
 
     example_id: UUID
     name: str
     email: str
+    event_type: str = field(default="example.created", init=False)
 
-    def __init__(self, example_id: UUID, name: str, email: str):
-        """Initialize event."""
-        super().__init__(
-            event_id=uuid4(),
-            timestamp=datetime.now(UTC),
-            event_type="example.created",
-        )
-        self.example_id = example_id
-        self.name = name
-        self.email = email
 
-
-@dataclass
+@dataclass(slots=True)
 class ExampleUpdatedEvent(DomainEvent):
     """Event emitted when an example is updated."""
 
     example_id: UUID
-    changes: dict[str, any]
-
-    def __init__(self, example_id: UUID, changes: dict[str, any]):
-        """Initialize event."""
-        super().__init__(
-            event_id=uuid4(),
-            timestamp=datetime.now(UTC),
-            event_type="example.updated",
-        )
-        self.example_id = example_id
-        self.changes = changes
+    changes: dict[str, Any]
+    event_type: str = field(default="example.updated", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExampleDeletedEvent(DomainEvent):
     """Event emitted when an example is deleted."""
 
     example_id: UUID
-
-    def __init__(self, example_id: UUID):
-        """Initialize event."""
-        super().__init__(
-            event_id=uuid4(),
-            timestamp=datetime.now(UTC),
-            event_type="example.deleted",
-        )
-        self.example_id = example_id
+    event_type: str = field(default="example.deleted", init=False)
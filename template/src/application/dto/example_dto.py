@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
 
-from domain.entities.example import ExampleEntity
+from application.domain.entities.example import ExampleEntity
 
 
 class CreateExampleDTO(BaseModel):
@@ -35,8 +35,13 @@ class ExampleDTO(BaseModel):
 
     @classmethod
     def from_entity(cls, entity: ExampleEntity) -> "ExampleDTO":
-        """Create DTO from domain entity."""
-        return cls(
+        """
+        Create DTO from domain entity.
+
+        Entities are the validation boundary, so their fields are trusted
+        and the DTO is built without re-running validation.
+        """
+        return cls.model_construct(
             id=entity.id,
             name=entity.name,
             email=entity.email,
@@ -0,0 +1,43 @@
+"""Cache port - interface for short-lived key-value caching."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Cache(ABC):
+    """Cache interface."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Expiry in seconds (defaults to the configured cache TTL)
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Remove a cached value.
+
+        Args:
+            key: Cache key
+        """
+        pass
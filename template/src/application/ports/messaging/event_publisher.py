@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from domain.events.example_events import DomainEvent
+from application.domain.events.example_events import DomainEvent
 
 
 class EventPublisher(ABC):
@@ -19,6 +19,19 @@ class EventPublisher(ABC):
         """
         pass
 
+    @abstractmethod
+    async def enqueue(self, event: DomainEvent, topic: str) -> None:
+        """
+        Queue a domain event to be published in the background.
+
+        Returns as soon as the event is queued; waits only when the queue is full.
+
+        Args:
+            event: Domain event to publish
+            topic: Target topic name
+        """
+        pass
+
     @abstractmethod
     async def publish_batch(self, events: list[tuple[DomainEvent, str]]) -> None:
         """
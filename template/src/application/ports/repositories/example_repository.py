@@ -1,9 +1,29 @@
 """Repository port - interface for data access (Dependency Inversion Principle)."""
 
+# Annotations such as list[UUID] are evaluated lazily: in the class body below
+# `list` names the list() method, not the builtin
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
-from domain.entities.example import ExampleEntity
+from application.dto.example_dto import ExampleDTO
+from application.domain.entities.example import ExampleEntity
+
+# (created_at, id) of the last item on the previous page. The id breaks ties
+# between examples created at the same instant (e.g. one bulk_create batch)
+ListCursor = tuple[datetime, UUID]
+
+
+class DuplicateEmailsError(ValueError):
+    """Some entities of a bulk_create() were not created: their email is taken."""
+
+    def __init__(self, emails: list[str], created: list[ExampleEntity]):
+        super().__init__(f"Emails already exist: {', '.join(emails)}")
+        self.emails = emails
+        # The entities that were created despite the duplicates
+        self.created = created
 
 
 class ExampleRepository(ABC):
@@ -11,7 +31,17 @@ class ExampleRepository(ABC):
 
     @abstractmethod
     async def create(self, entity: ExampleEntity) -> ExampleEntity:
-        """Create a new entity."""
+        """Create a new entity; raises ValueError if its email is taken."""
+        pass
+
+    @abstractmethod
+    async def bulk_create(self, entities: list[ExampleEntity]) -> list[ExampleEntity]:
+        """
+        Create multiple entities in a single round-trip.
+
+        Entities with a free email are created even if others are rejected;
+        raises DuplicateEmailsError, holding the created ones, if any were.
+        """
         pass
 
     @abstractmethod
@@ -19,14 +49,28 @@ class ExampleRepository(ABC):
         """Get entity by ID."""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, entity_ids: list[UUID]) -> list[ExampleEntity]:
+        """Get the entities that exist among the given IDs, in one round-trip."""
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> ExampleEntity | None:
         """Get entity by email."""
         pass
 
     @abstractmethod
-    async def list(self, skip: int = 0, limit: int = 100) -> list[ExampleEntity]:
-        """List entities with pagination."""
+    async def list(
+        self, skip: int = 0, limit: int = 100, cursor: ListCursor | None = None
+    ) -> list[ExampleEntity]:
+        """List entities newest first, optionally only those after cursor."""
+        pass
+
+    @abstractmethod
+    async def list_as_dto(
+        self, skip: int = 0, limit: int = 100, cursor: ListCursor | None = None
+    ) -> list[ExampleDTO]:
+        """Like list(), but read straight into response DTOs for read-only callers."""
         pass
 
     @abstractmethod
@@ -39,7 +83,17 @@ class ExampleRepository(ABC):
         """Delete an entity."""
         pass
 
+    @abstractmethod
+    async def bulk_delete(self, entity_ids: list[UUID]) -> int:
+        """Delete multiple entities, returning how many were deleted."""
+        pass
+
     @abstractmethod
     async def count(self) -> int:
         """Count total entities."""
         pass
+
+    @abstractmethod
+    async def count_estimated(self) -> int:
+        """Approximate total entities from collection metadata."""
+        pass
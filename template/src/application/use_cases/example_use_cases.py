@@ -1,15 +1,60 @@
 """Use cases - application business logic orchestration."""
 
+import asyncio
+from typing import Any
 from uuid import UUID
 
 from application.dto.example_dto import CreateExampleDTO, ExampleDTO
-
-# from application.ports.messaging.event_publisher import EventPublisher
-# from domain.events.example_events import ExampleCreatedEvent
-from application.ports.repositories.example_repository import ExampleRepository
-from domain.entities.example import ExampleEntity
+from application.ports.cache.cache import Cache
+from application.ports.messaging.event_publisher import EventPublisher
+from application.domain.events.example_events import ExampleCreatedEvent
+from application.ports.repositories.example_repository import (
+    ExampleRepository,
+    ListCursor,
+)
+from application.domain.entities.example import ExampleEntity
 from infra.logging import logger
 
+# How long an email lookup result is trusted; "free" is kept short because the
+# email can be taken by another process at any time
+EMAIL_TAKEN_TTL = 300
+EMAIL_FREE_TTL = 30
+
+
+def _email_key(email: str) -> str:
+    """Cache key recording whether an email is taken."""
+    return f"email_exists:{email}"
+
+
+# The cache only saves database lookups, so it fails open like the rate
+# limiter: errors are logged and treated as a miss.
+async def _cache_get(cache: Cache | None, key: str) -> Any | None:
+    if cache is None:
+        return None
+    try:
+        return await cache.get(key)
+    except Exception as e:
+        logger.error("cache_get_failed", key=key, error=str(e))
+        return None
+
+
+async def _cache_set(cache: Cache | None, key: str, value: Any, ttl: int) -> None:
+    if cache is None:
+        return
+    try:
+        await cache.set(key, value, ttl=ttl)
+    except Exception as e:
+        logger.error("cache_set_failed", key=key, error=str(e))
+
+
+async def _cache_delete(cache: Cache | None, key: str) -> None:
+    if cache is None:
+        return
+    try:
+        await cache.delete(key)
+    except Exception as e:
+        logger.error("cache_delete_failed", key=key, error=str(e))
+
 
 class CreateExampleUseCase:
     """Use case for creating an example."""
@@ -17,11 +62,23 @@ class CreateExampleUseCase:
     def __init__(
         self,
         repository: ExampleRepository,
-        # event_publisher: EventPublisher,
+        *,
+        event_publisher: EventPublisher | None = None,
+        event_topic: str = "",
+        cache: Cache | None = None,
     ):
-        """Initialize use case with dependencies."""
+        """
+        Initialize use case with dependencies.
+
+        Without a publisher events are not sent (nor when it fails to queue
+        one); without a cache every email check goes to the repository.
+        """
+        if event_publisher and not event_topic:
+            raise ValueError("event_topic is required with an event_publisher")
         self.repository = repository
-        # self.event_publisher = event_publisher
+        self.event_publisher = event_publisher
+        self.event_topic = event_topic
+        self.cache = cache
 
     async def execute(self, dto: CreateExampleDTO) -> ExampleDTO:
         """
@@ -33,9 +90,18 @@ class CreateExampleUseCase:
         Returns:
             Created example DTO
         """
-        # Check if email already exists
-        existing = await self.repository.get_by_email(dto.email)
-        if existing:
+        # Check if email already exists, asking the cache before the database
+        email_key = _email_key(dto.email)
+        exists = await _cache_get(self.cache, email_key)
+        if exists is None:
+            exists = await self.repository.get_by_email(dto.email) is not None
+            await _cache_set(
+                self.cache,
+                email_key,
+                exists,
+                ttl=EMAIL_TAKEN_TTL if exists else EMAIL_FREE_TTL,
+            )
+        if exists:
             raise ValueError(f"Email {dto.email} already exists")
 
         # Create domain entity
@@ -44,20 +110,35 @@ class CreateExampleUseCase:
             email=dto.email,
         )
 
-        # Persist entity
-        created_entity = await self.repository.create(entity)
-
-        # Publish domain event
-        # event = ExampleCreatedEvent(
-        #     example_id=created_entity.id,
-        #     name=created_entity.name,
-        #     email=created_entity.email,
-        # )
-        # await self.event_publisher.publish(event, "example-events")
+        # Persist entity; the repository rejects an email taken since the check
+        try:
+            created_entity = await self.repository.create(entity)
+        except ValueError:
+            await _cache_set(self.cache, email_key, True, ttl=EMAIL_TAKEN_TTL)
+            raise
+        await _cache_set(self.cache, email_key, True, ttl=EMAIL_TAKEN_TTL)
+
+        # Publish domain event in the background, off the request path. The
+        # example is already saved, so a failure is logged rather than raised
+        if self.event_publisher:
+            event = ExampleCreatedEvent(
+                example_id=created_entity.id,
+                name=created_entity.name,
+                email=created_entity.email,
+            )
+            try:
+                await self.event_publisher.enqueue(event, self.event_topic)
+            except Exception as e:
+                logger.error(
+                    "example_event_enqueue_failed",
+                    example_id=created_entity.id,
+                    event_id=event.event_id,
+                    error=str(e),
+                )
 
         logger.info(
             "example_created",
-            example_id=str(created_entity.id),
+            example_id=created_entity.id,  # orjson renders UUIDs natively
             email=created_entity.email,
         )
 
@@ -96,16 +177,72 @@ class ListExamplesUseCase:
         """Initialize use case with dependencies."""
         self.repository = repository
 
-    async def execute(self, skip: int = 0, limit: int = 100) -> list[ExampleDTO]:
+    async def execute(
+        self, skip: int = 0, limit: int = 100, cursor: ListCursor | None = None
+    ) -> list[ExampleDTO]:
         """
-        List examples with pagination.
+        List examples with pagination, newest first.
 
         Args:
             skip: Number of items to skip
             limit: Maximum number of items to return
+            cursor: (created_at, id) of the last example on the previous page
 
         Returns:
             List of example DTOs
         """
-        entities = await self.repository.list(skip=skip, limit=limit)
-        return [ExampleDTO.from_entity(entity) for entity in entities]
+        # Read-only path: the repository projects straight into DTOs
+        return await self.repository.list_as_dto(skip=skip, limit=limit, cursor=cursor)
+
+
+class DeleteExampleUseCase:
+    """Use case for deleting an example."""
+
+    def __init__(self, repository: ExampleRepository, *, cache: Cache | None = None):
+        """Initialize use case with dependencies."""
+        self.repository = repository
+        self.cache = cache
+
+    async def execute(self, example_id: UUID) -> bool:
+        """
+        Delete an example, freeing its email for reuse right away.
+
+        Args:
+            example_id: Example ID
+
+        Returns:
+            True if the example existed and was deleted
+        """
+        entity = await self.repository.get_by_id(example_id)
+        if not entity or not await self.repository.delete(example_id):
+            return False
+
+        await _cache_delete(self.cache, _email_key(entity.email))
+        return True
+
+
+class BulkDeleteExamplesUseCase:
+    """Use case for deleting several examples at once."""
+
+    def __init__(self, repository: ExampleRepository, *, cache: Cache | None = None):
+        """Initialize use case with dependencies."""
+        self.repository = repository
+        self.cache = cache
+
+    async def execute(self, example_ids: list[UUID]) -> int:
+        """
+        Delete examples, freeing their emails for reuse right away.
+
+        Args:
+            example_ids: Example IDs
+
+        Returns:
+            Number of examples deleted
+        """
+        entities = await self.repository.get_by_ids(example_ids)
+        deleted = await self.repository.bulk_delete([e.id for e in entities])
+
+        await asyncio.gather(
+            *(_cache_delete(self.cache, _email_key(e.email)) for e in entities)
+        )
+        return deleted
@@ -1,11 +1,16 @@
-from pydantic import BaseModel, Field, RedisDsn
+from pydantic import BaseModel, Field, RedisDsn, field_validator
 from typing import Literal
 
+RATE_WINDOWS_MS = {
+    "second": 1_000,
+    "minute": 60_000,
+    "hour": 3_600_000,
+    "day": 86_400_000,
+}
+
 
 class OpenTelemetry(BaseModel):
-    disabled_instrumentations: list[str] = Field(
-        default_factory=list, default=["requests"]
-    )
+    disabled_instrumentations: list[str] = Field(default=["requests"])
 
 
 class LDSettings(BaseModel):
@@ -14,7 +19,28 @@ class LDSettings(BaseModel):
 
 class RateLimit(BaseModel):
     enabled: bool = Field(default=True, description="Enable rate limiting")
-    rate: str = Field(default="60/minute", description="Requests per minute per IP")
+    rate: str = Field(default="60/minute", description="Requests per window per IP")
+
+    @field_validator("rate")
+    @classmethod
+    def validate_rate(cls, value: str) -> str:
+        """Reject malformed rate specs at startup instead of on first request."""
+        limit, _, unit = value.partition("/")
+        if not limit.strip().isdigit() or unit.strip().lower() not in RATE_WINDOWS_MS:
+            raise ValueError(
+                f"rate must look like '<int>/<{'|'.join(RATE_WINDOWS_MS)}>', got {value!r}"
+            )
+        return value
+
+    @property
+    def limit(self) -> int:
+        """Get the number of requests allowed per window."""
+        return int(self.rate.partition("/")[0])
+
+    @property
+    def window_ms(self) -> int:
+        """Get the rate limit window in milliseconds."""
+        return RATE_WINDOWS_MS[self.rate.partition("/")[2].strip().lower()]
 
 
 class JWTSettings(BaseModel):
@@ -32,6 +58,12 @@ class RedisSettings(BaseModel):
     socket_connect_timeout: int = Field(
         default=5, description="Redis connection timeout"
     )
+    pool_timeout: int = Field(
+        default=5, description="Max seconds to wait for a free pooled connection"
+    )
+    health_check_interval: int = Field(
+        default=30, description="Seconds a connection may idle before a health check"
+    )
 
 
 class KafkaSettings(BaseModel):
@@ -48,12 +80,49 @@ class KafkaSettings(BaseModel):
         default="earliest", description="Kafka auto offset reset"
     )
     enable_auto_commit: bool = Field(
-        default=True, description="Enable Kafka auto commit"
+        default=False,
+        description="Enable Kafka auto commit (otherwise commit once per batch)",
+    )
+    max_poll_records: int = Field(
+        default=500, description="Max records per poll (consumer batch size)"
+    )
+    poll_timeout_ms: int = Field(
+        default=500, description="Max time to wait for a consumer batch"
+    )
+    handler_concurrency: int = Field(
+        default=100, description="Max handlers running at once per batch"
+    )
+    max_retries: int = Field(
+        default=3, description="Redeliveries of a failing message before it is skipped"
+    )
+    retry_backoff_ms: int = Field(
+        default=500, description="Delay before the first redelivery, doubled per retry"
+    )
+    compression_type: Literal["gzip", "snappy", "lz4", "zstd"] | None = Field(
+        default="lz4", description="Kafka producer compression codec"
+    )
+    linger_ms: int = Field(
+        default=10, description="Time the producer waits to fill a batch"
+    )
+    acks: Literal[0, 1, "all"] = Field(
+        default=1, description="Broker acknowledgements required per send"
+    )
+    max_batch_size: int = Field(
+        default=262144, description="Max producer batch size in bytes"
+    )
+    publish_queue_size: int = Field(
+        default=10000, description="Max events queued for background publishing"
+    )
+    publish_batch_size: int = Field(
+        default=500, description="Max queued events published per batch"
     )
-    max_poll_records: int = Field(default=100, description="Max records per poll")
     schema_registry_url: str = Field(
         default="http://localhost:8081", description="Schema Registry URL"
     )
+    use_schema_registry: bool = Field(
+        default=False,
+        description="Consume Confluent wire-format messages via the Schema Registry",
+    )
 
     @property
     def topics(self) -> list[str]:
@@ -82,6 +151,13 @@ class CacheSettings(BaseModel):
     )
 
 
+class LoggingSettings(BaseModel):
+    enqueue: bool = Field(
+        default=False,
+        description="Queue log records to a writer thread (only for multi-process sinks)",
+    )
+
+
 class DatabaseSettings(BaseModel):
     # Database
     url: str = Field(
@@ -111,12 +187,13 @@ class Settings(BaseModel):
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(ge=4000, le=8000, default=8000, description="Server port")
 
-    database: DatabaseSettings
-    cache: CacheSettings
-    cors: CORSSettings
-    rate_limiter: RateLimit
-    redis: RedisSettings
-    otel: OpenTelemetry
-    ld: LDSettings
-    jwt: JWTSettings
-    kafka: KafkaSettings
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    cors: CORSSettings = Field(default_factory=CORSSettings)
+    rate_limiter: RateLimit = Field(default_factory=RateLimit)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
+    otel: OpenTelemetry = Field(default_factory=OpenTelemetry)
+    ld: LDSettings = Field(default_factory=LDSettings)
+    jwt: JWTSettings = Field(default_factory=JWTSettings)
+    kafka: KafkaSettings = Field(default_factory=KafkaSettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
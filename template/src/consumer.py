@@ -0,0 +1,38 @@
+"""Kafka event consumer entrypoint."""
+
+import asyncio
+from typing import Any
+
+from config import get_settings
+from infra.logging import logger
+from infra.messaging import KafkaConsumer
+from infra.messaging.event_publisher_impl import EVENT_SCHEMA
+
+
+async def handle_example_event(message: dict[str, Any]) -> None:
+    """Handle example domain events."""
+    logger.info(
+        "example_event_received",
+        event_type=message["event_type"],
+        event_id=message["event_id"],
+    )
+
+
+async def main() -> None:
+    """Register handlers and consume until interrupted."""
+    settings = get_settings()
+
+    # Register event handlers here
+    for topic in settings.kafka.topics:
+        KafkaConsumer.register_handler(topic, handle_example_event)
+
+    await KafkaConsumer.start(settings, EVENT_SCHEMA)
+    try:
+        await KafkaConsumer.consume()
+    finally:
+        await KafkaConsumer.stop()
+        logger.complete()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,3 +1,4 @@
-from .rate_limiter import RateLimiter
+from .redis_manager import RedisManager
+from .redis_cache import RedisCache
 
-__all__ = ["RateLimiter"]
+__all__ = ["RedisManager", "RedisCache"]
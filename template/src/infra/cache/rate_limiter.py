@@ -1,4 +0,0 @@
-class RateLimiter:
-    def check_rate_limit(key: str, limit: int, window: int = 60):
-        """Client specific implementation"""
-        return True
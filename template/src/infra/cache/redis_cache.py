@@ -0,0 +1,22 @@
+"""Cache implementation using Redis."""
+
+from typing import Any
+
+from application.ports.cache.cache import Cache
+from infra.cache.redis_manager import RedisManager
+
+
+class RedisCache(Cache):
+    """Cache backed by the shared RedisManager client."""
+
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value."""
+        return await RedisManager.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Cache a value."""
+        await RedisManager.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        await RedisManager.delete(key)
@@ -0,0 +1,154 @@
+"""Redis connection manager for caching and rate limiting."""
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+import orjson
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+from infra.logging import logger
+from config import Settings
+
+# Values whose top-level container is larger than this are encoded in a worker
+# thread. sys.getsizeof is shallow, so this is a cheap proxy for "many items"
+# rather than the encoded size.
+_OFFLOAD_ENCODE_SIZE = 4096
+
+# Sliding-window counter: count the hits in the current window and weight the
+# previous window by how much of it still overlaps, in one atomic round-trip.
+# KEYS: current window, previous window. ARGV: window_ms, elapsed_ms, hits.
+RATE_LIMIT_SCRIPT = """
+local window = tonumber(ARGV[1])
+local hits = tonumber(ARGV[3])
+local cur = redis.call('INCRBY', KEYS[1], hits)
+if cur == hits then redis.call('PEXPIRE', KEYS[1], window * 2) end
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+return math.floor(prev * (window - tonumber(ARGV[2])) / window + cur)
+"""
+
+
+class RedisManager:
+    """
+    Redis connection manager.
+
+    The cache and rate-limit helpers run on every request, so they use the
+    client without re-checking it; connect() must have been awaited first
+    (the application lifespan does this before serving). The client and script
+    are therefore declared non-optional and only assigned by connect().
+    """
+
+    client: redis.Redis
+    rate_limit_script: AsyncScript
+    _connected: bool = False
+    # Encoded once at connect(); redis-py sends bytes keys without re-encoding
+    key_prefix: bytes = b""
+    rate_key_prefix: bytes = b"rate:"
+    default_ttl: int = 300
+
+    @classmethod
+    async def connect(cls, settings: Settings) -> None:
+        """Initialize Redis connection and preload scripts."""
+        try:
+            redis_url = str(settings.redis.url)
+
+            # Bursts wait up to pool_timeout for a free connection instead of
+            # failing, and idle sockets are checked before reuse.
+            # Values stay bytes: orjson reads and writes them without a str copy
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                decode_responses=False,
+                max_connections=settings.redis.max_connections,
+                timeout=settings.redis.pool_timeout,
+                health_check_interval=settings.redis.health_check_interval,
+                socket_keepalive=True,
+                socket_timeout=settings.redis.socket_timeout,
+                socket_connect_timeout=settings.redis.socket_connect_timeout,
+            )
+            cls.client = redis.Redis.from_pool(pool)
+            cls.key_prefix = settings.cache.key_prefix.encode()
+            cls.rate_key_prefix = cls.key_prefix + b"rate:"
+            cls.default_ttl = settings.cache.ttl
+
+            # Every check is a single EVALSHA; the script reloads itself on NOSCRIPT
+            cls.rate_limit_script = cls.client.register_script(RATE_LIMIT_SCRIPT)
+            cls._connected = True
+
+            logger.info(
+                "redis_connected",
+                url=redis_url.split("@")[-1],  # Hide credentials
+            )
+        except Exception as e:
+            logger.error("redis_connection_failed", error=str(e))
+            raise
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close Redis connection."""
+        if cls._connected:
+            cls._connected = False
+            await cls.client.aclose()
+            logger.info("redis_disconnected")
+
+    @classmethod
+    def get_client(cls) -> redis.Redis:
+        """Get Redis client."""
+        if not cls._connected:
+            raise RuntimeError("Redis not initialized. Call connect() first.")
+        return cls.client
+
+    @classmethod
+    async def get(cls, key: str) -> Any | None:
+        """Get a cached value, or None on a miss."""
+        value = await cls.client.get(cls.key_prefix + key.encode())
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+    @classmethod
+    async def set(cls, key: str, value: Any, ttl: int | None = None) -> None:
+        """Cache a JSON-serializable value, expiring after ttl seconds."""
+        if sys.getsizeof(value) > _OFFLOAD_ENCODE_SIZE:
+            # Keep large encodes from stalling other requests on the event loop
+            data = await asyncio.to_thread(orjson.dumps, value)
+        else:
+            data = orjson.dumps(value)
+        await cls.client.setex(
+            cls.key_prefix + key.encode(),
+            ttl if ttl is not None else cls.default_ttl,
+            data,
+        )
+
+    @classmethod
+    async def delete(cls, key: str) -> None:
+        """Remove a cached value."""
+        await cls.client.delete(cls.key_prefix + key.encode())
+
+    @classmethod
+    async def check_rate_limit(
+        cls, key: str, limit: int, window_ms: int, hits: int = 1
+    ) -> tuple[bool, int]:
+        """
+        Count hits for key against a sliding window.
+
+        Args:
+            key: Rate limit key (e.g. client IP)
+            limit: Maximum hits allowed per window
+            window_ms: Window length in milliseconds
+            hits: Number of hits to count (callers may batch them locally)
+
+        Returns:
+            Tuple of (is_allowed, milliseconds until the current window ends)
+        """
+        window_idx, elapsed_ms = divmod(int(time.time() * 1000), window_ms)
+        rate_key = cls.rate_key_prefix + key.encode()
+        weighted = await cls.rate_limit_script(
+            keys=[
+                b"%b:%d" % (rate_key, window_idx),
+                b"%b:%d" % (rate_key, window_idx - 1),
+            ],
+            args=[window_ms, elapsed_ms, hits],
+        )
+        return weighted <= limit, window_ms - elapsed_ms
@@ -2,9 +2,16 @@
 
 from datetime import datetime, UTC
 from typing import Any
+from uuid import UUID
 
 from beanie import Document, Indexed
-from pydantic import EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field
+
+from application.dto.example_dto import ExampleDTO
+
+# Default list order, newest first. _id orders examples created at the same
+# instant, so keyset paging on (created_at, _id) returns each example once
+LIST_ORDER = [("created_at", -1), ("_id", -1)]
 
 
 class ExampleDocument(Document):
@@ -24,10 +31,40 @@ class ExampleDocument(Document):
         indexes = [
             "email",
             "name",
-            "created_at",
+            LIST_ORDER,
+            # Listing active/inactive examples in default order
+            [("is_active", 1), *LIST_ORDER],
         ]
 
 
+class ExampleProjection(BaseModel):
+    """ExampleDocument fields needed to build an ExampleEntity."""
+
+    id: UUID = Field(alias="_id")
+    name: str
+    email: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class ExampleDTOProjection(ExampleDTO):
+    """ExampleDocument fields projected straight into the response DTO."""
+
+    class Settings:
+        """Beanie projection, renaming _id so no alias is needed on the DTO."""
+
+        projection = {
+            "_id": 0,
+            "id": "$_id",
+            "name": 1,
+            "email": 1,
+            "is_active": 1,
+            "created_at": 1,
+            "updated_at": 1,
+        }
+
+
 def get_document_models() -> list[type[Document]]:
     """Get all document models for Beanie initialization."""
     return [
@@ -1,10 +1,50 @@
 """Repository implementation using Beanie ODM."""
 
+# Annotations such as list[UUID] are evaluated lazily: in the class body below
+# `list` names the list() method, not the builtin
+from __future__ import annotations
+
+from typing import Any
 from uuid import UUID
 
-from application.ports.repositories.example_repository import ExampleRepository
+from beanie import UpdateResponse
+from beanie.odm.queries.find import FindMany
+from beanie.operators import In
+from pydantic import BaseModel
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from application.dto.example_dto import ExampleDTO
+from application.ports.repositories.example_repository import (
+    DuplicateEmailsError,
+    ExampleRepository,
+    ListCursor,
+)
 from application.domain.entities.example import ExampleEntity
-from infra.database.models import ExampleDocument
+from infra.database.models import (
+    ExampleDocument,
+    ExampleDTOProjection,
+    ExampleProjection,
+    LIST_ORDER,
+)
+
+# MongoDB error code for a unique index violation
+_DUPLICATE_KEY = 11000
+
+# Document fields copied onto ExampleEntity
+_ENTITY_FIELDS = frozenset(
+    {"id", "name", "email", "is_active", "created_at", "updated_at"}
+)
+
+
+def _after_cursor(cursor: ListCursor) -> dict[str, Any]:
+    """Filter for the documents after cursor in LIST_ORDER."""
+    created_at, last_id = cursor
+    # The created_at bound keeps this an index range scan; the $or then drops
+    # the boundary documents already returned (ids >= last_id)
+    return {
+        "created_at": {"$lte": created_at},
+        "$or": [{"created_at": {"$lt": created_at}}, {"_id": {"$lt": last_id}}],
+    }
 
 
 class BeanieExampleRepository(ExampleRepository):
@@ -12,17 +52,36 @@ class BeanieExampleRepository(ExampleRepository):
 
     async def create(self, entity: ExampleEntity) -> ExampleEntity:
         """Create a new entity."""
-        document = ExampleDocument(
-            id=entity.id,
-            name=entity.name,
-            email=entity.email,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-        await document.insert()
+        try:
+            await self._to_document(entity).insert()
+        except DuplicateKeyError as e:
+            # The unique email index is the authority; callers' lookups can race
+            raise ValueError(f"Email {entity.email} already exists") from e
         return entity
 
+    async def bulk_create(self, entities: list[ExampleEntity]) -> list[ExampleEntity]:
+        """Create multiple entities in a single round-trip."""
+        if not entities:
+            return entities
+
+        try:
+            await ExampleDocument.insert_many(
+                [self._to_document(entity) for entity in entities], ordered=False
+            )
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if e.details.get("writeConcernErrors") or any(
+                error["code"] != _DUPLICATE_KEY for error in errors
+            ):
+                raise
+            # Unordered: every document without a write error was inserted
+            rejected = {error["index"] for error in errors}
+            raise DuplicateEmailsError(
+                [entities[i].email for i in sorted(rejected)],
+                [entity for i, entity in enumerate(entities) if i not in rejected],
+            ) from e
+        return entities
+
     async def get_by_id(self, entity_id: UUID) -> ExampleEntity | None:
         """Get entity by ID."""
         document = await ExampleDocument.get(entity_id)
@@ -31,6 +90,16 @@ class BeanieExampleRepository(ExampleRepository):
 
         return self._to_entity(document)
 
+    async def get_by_ids(self, entity_ids: list[UUID]) -> list[ExampleEntity]:
+        """Get the entities that exist among the given IDs, in one round-trip."""
+        if not entity_ids:
+            return []
+
+        documents = await ExampleDocument.find(
+            In(ExampleDocument.id, entity_ids), projection_model=ExampleProjection
+        ).to_list()
+        return [self._to_entity(doc) for doc in documents]
+
     async def get_by_email(self, email: str) -> ExampleEntity | None:
         """Get entity by email."""
         document = await ExampleDocument.find_one(ExampleDocument.email == email)
@@ -39,45 +108,103 @@ class BeanieExampleRepository(ExampleRepository):
 
         return self._to_entity(document)
 
-    async def list(self, skip: int = 0, limit: int = 100) -> list[ExampleEntity]:
-        """List entities with pagination."""
-        documents = await ExampleDocument.find_all().skip(skip).limit(limit).to_list()
+    async def list(
+        self, skip: int = 0, limit: int = 100, cursor: ListCursor | None = None
+    ) -> list[ExampleEntity]:
+        """
+        List entities newest first, backed by the (created_at, _id) index.
+
+        Pass the (created_at, id) of the last item as cursor to page by key
+        instead of by offset, which stays O(log N) however deep the page is.
+        """
+        documents = await self._list_query(
+            ExampleProjection, skip, limit, cursor
+        ).to_list()
         return [self._to_entity(doc) for doc in documents]
 
+    async def list_as_dto(
+        self, skip: int = 0, limit: int = 100, cursor: ListCursor | None = None
+    ) -> list[ExampleDTO]:
+        """List entities as DTOs, skipping entity hydration entirely."""
+        return await self._list_query(
+            ExampleDTOProjection, skip, limit, cursor
+        ).to_list()
+
     async def update(self, entity: ExampleEntity) -> ExampleEntity:
         """Update an existing entity."""
-        document = await ExampleDocument.get(entity.id)
+        document = await ExampleDocument.find_one(
+            ExampleDocument.id == entity.id
+        ).update(
+            {
+                "$set": {
+                    "name": entity.name,
+                    "email": entity.email,
+                    "is_active": entity.is_active,
+                    "updated_at": entity.updated_at,
+                }
+            },
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
         if not document:
             raise ValueError(f"Entity with id {entity.id} not found")
 
-        document.name = entity.name
-        document.email = entity.email
-        document.is_active = entity.is_active
-        document.updated_at = entity.updated_at
-
-        await document.save()
         return entity
 
     async def delete(self, entity_id: UUID) -> bool:
         """Delete an entity."""
-        document = await ExampleDocument.get(entity_id)
-        if not document:
-            return False
+        result = await ExampleDocument.find_one(
+            ExampleDocument.id == entity_id
+        ).delete()
+        return bool(result and result.deleted_count)
 
-        await document.delete()
-        return True
+    async def bulk_delete(self, entity_ids: list[UUID]) -> int:
+        """Delete multiple entities, returning how many were deleted."""
+        if not entity_ids:
+            return 0
+
+        result = await ExampleDocument.find(In(ExampleDocument.id, entity_ids)).delete()
+        return result.deleted_count if result else 0
 
     async def count(self) -> int:
         """Count total entities."""
         return await ExampleDocument.count()
 
-    def _to_entity(self, document: ExampleDocument) -> ExampleEntity:
-        """Convert document to domain entity."""
-        return ExampleEntity(
-            id=document.id,
-            name=document.name,
-            email=document.email,
-            is_active=document.is_active,
-            created_at=document.created_at,
-            updated_at=document.updated_at,
+    async def count_estimated(self) -> int:
+        """Approximate total entities from collection metadata, without a scan."""
+        return await ExampleDocument.get_pymongo_collection().estimated_document_count()
+
+    def _list_query(
+        self,
+        projection_model: type[BaseModel],
+        skip: int,
+        limit: int,
+        cursor: ListCursor | None,
+    ) -> FindMany:
+        """Build the newest-first list query shared by list() and list_as_dto()."""
+        return (
+            ExampleDocument.find(
+                _after_cursor(cursor) if cursor else {},
+                projection_model=projection_model,
+            )
+            .sort(LIST_ORDER)
+            .skip(skip)
+            .limit(limit)
+        )
+
+    def _to_document(self, entity: ExampleEntity) -> ExampleDocument:
+        """Convert domain entity to document."""
+        return ExampleDocument(
+            id=entity.id,
+            name=entity.name,
+            email=entity.email,
+            is_active=entity.is_active,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
         )
+
+    def _to_entity(
+        self, document: ExampleDocument | ExampleProjection
+    ) -> ExampleEntity:
+        """Convert document to domain entity."""
+        # model_dump extracts all fields in one call into pydantic-core
+        return ExampleEntity(**document.model_dump(include=_ENTITY_FIELDS))
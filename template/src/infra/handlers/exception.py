@@ -2,7 +2,7 @@ from fastapi import Request, status as HTTPStatus
 from fastapi.responses import JSONResponse
 
 from infra.logging import logger
-from template.src.infra.errors.operational_exception import OperationalException
+from infra.errors.operational_exception import OperationalException
 
 
 async def app_exception_handler(
@@ -1,3 +1,3 @@
-from .logging import logger
+from .logging import logger, correlation_id_var
 
-__all__ = ["logger"]
+__all__ = ["logger", "correlation_id_var"]
@@ -1,9 +1,10 @@
 """Structured logging configuration."""
 
 import sys
-import json
 import traceback
+from contextvars import ContextVar
 
+import orjson
 from loguru import logger
 
 from config.main import get_settings
@@ -13,10 +14,15 @@ settings = get_settings()
 
 # Set up base logging level
 log_level = "DEBUG" if settings.debug else "INFO"
+_min_level_no = logger.level(log_level).no
+
+# Request-scoped context, read lazily when a record is actually emitted
+correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 
 
 def serialize(record):
     fields = {
+        # loguru's datetime subclass is not native to orjson; format it explicitly
         "time": record["time"].strftime("%Y-%m-%dT%H:%M:%S.%f%z"),
         "level": record["level"].name,
         "message": record["message"],
@@ -30,21 +36,42 @@ def serialize(record):
         fields["exception"] = {
             "type": exc.type.__name__,
             "value": str(exc.value),
-            "traceback": traceback.format_exception(exc.type, exc.value, exc.traceback),
+            "traceback": "".join(
+                traceback.format_exception(exc.type, exc.value, exc.traceback)
+            ),
         }
 
-    return json.dumps(fields)
+    return orjson.dumps(fields, default=str, option=orjson.OPT_APPEND_NEWLINE)
 
 
 def patching(record):
+    # Patching runs before the sink's level filter; don't serialize dropped records
+    if record["level"].no < _min_level_no:
+        record["serialized"] = b""
+        return
+
+    # Outside a request (startup, consumers) there is no ID to attach
+    correlation_id = correlation_id_var.get()
+    if correlation_id:
+        record["extra"]["correlation_id"] = correlation_id
     record["serialized"] = serialize(record)
 
 
+def write_serialized(message):
+    # orjson already produced UTF-8 bytes; skip the text layer's re-encode
+    stream = sys.stderr.buffer
+    stream.write(message.record["serialized"])
+    stream.flush()
+
+
 logger.remove(0)
 logger = logger.patch(patching)
 logger.add(
-    sys.stderr,
+    write_serialized,
     level=log_level,
-    enqueue=True,  # non-blocking and safe across threads/processes
-    format="{serialized}\n",
+    # Direct writes are cheaper for a single worker; the queue pickles records
+    enqueue=settings.logging.enqueue,
+    # The sink writes record["serialized"]; a callable format also stops loguru
+    # from rendering tracebacks that serialize() already captured
+    format=lambda record: "",
 )
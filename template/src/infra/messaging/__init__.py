@@ -0,0 +1,6 @@
+from .kafka_producer import KafkaProducer
+from .kafka_consumer import KafkaConsumer
+from .schema_registry import SchemaRegistry
+from .event_publisher_impl import KafkaEventPublisher
+
+__all__ = ["KafkaProducer", "KafkaConsumer", "SchemaRegistry", "KafkaEventPublisher"]
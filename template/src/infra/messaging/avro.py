@@ -0,0 +1,25 @@
+"""Parsed Avro schema cache shared by the producer, consumer and registry."""
+
+from functools import lru_cache
+from typing import Any
+
+import fastavro
+import orjson
+
+# Parsed schemas kept per process; least recently used entries are evicted first
+SCHEMA_CACHE_SIZE = 1000
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _parse_canonical(canonical: bytes) -> Any:
+    return fastavro.parse_schema(orjson.loads(canonical))
+
+
+def parse_schema_cached(schema: dict[str, Any]) -> Any:
+    """
+    Parse an Avro schema, reusing the parsed object for identical schemas.
+
+    Schemas are keyed by their canonical JSON (sorted keys), so equal schemas
+    rebuilt as new dicts, or registered under several ids, are parsed once.
+    """
+    return _parse_canonical(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
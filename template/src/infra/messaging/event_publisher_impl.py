@@ -0,0 +1,137 @@
+"""Event publisher implementation using Kafka."""
+
+import asyncio
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import fields
+from functools import cache
+from typing import Any
+
+import orjson
+
+from application.ports.messaging.event_publisher import EventPublisher
+from application.domain.events.example_events import DomainEvent
+from infra.logging import logger
+from infra.messaging.kafka_producer import KafkaProducer
+from config import Settings
+
+EVENT_SCHEMA = {
+    "type": "record",
+    "name": "DomainEvent",
+    "fields": [
+        {"name": "event_id", "type": "string"},
+        {"name": "event_type", "type": "string"},
+        {"name": "timestamp", "type": "string"},
+        # JSON-encoded event fields; consumers decode with orjson.loads
+        {"name": "payload", "type": "string"},
+    ],
+}
+
+# Parsed once and held by the producer; messages carry only their data
+KafkaProducer.register_schema(EVENT_SCHEMA, default=True)
+
+_ENVELOPE_FIELDS = ("event_id", "event_type", "timestamp")
+
+
+@cache
+def _payload_fields(event_cls: type[DomainEvent]) -> tuple[str, ...]:
+    """Names of the payload (non-envelope) fields of an event class."""
+    return tuple(f.name for f in fields(event_cls) if f.name not in _ENVELOPE_FIELDS)
+
+
+class KafkaEventPublisher(EventPublisher):
+    """Publish domain events to Kafka as Avro records."""
+
+    _queue: asyncio.Queue[tuple[DomainEvent, str]] | None = None
+    _drain_task: asyncio.Task[None] | None = None
+    _batch_size: int = 500
+    _settings: Settings | None = None
+
+    @classmethod
+    async def start(cls, settings: Settings) -> None:
+        """
+        Start the background task that publishes queued events.
+
+        The Kafka producer need not be running yet: the task (re)starts it
+        before a batch whenever it is not, e.g. after the broker was
+        unreachable at startup.
+        """
+        cls._settings = settings
+        cls._queue = asyncio.Queue(maxsize=settings.kafka.publish_queue_size)
+        cls._batch_size = settings.kafka.publish_batch_size
+        cls._drain_task = asyncio.create_task(cls._drain())
+        logger.info("event_publisher_started")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Publish any queued events, then stop the background task."""
+        if cls._drain_task:
+            await cls._queue.join()
+            cls._drain_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await cls._drain_task
+            cls._drain_task = None
+            logger.info("event_publisher_stopped")
+
+    @classmethod
+    async def _drain(cls) -> None:
+        """Publish queued events in batches until cancelled."""
+        queue = cls._queue
+        publisher = cls()
+        while True:
+            batch = [await queue.get()]
+            # Yield once so events queued by concurrent requests join this batch
+            await asyncio.sleep(0)
+            while len(batch) < cls._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                if not KafkaProducer.is_started():
+                    await KafkaProducer.start(cls._settings)
+                await publisher.publish_batch(batch)
+            except Exception as e:
+                logger.error(
+                    "event_batch_publish_failed", count=len(batch), error=str(e)
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def enqueue(self, event: DomainEvent, topic: str) -> None:
+        """Queue a domain event for the background publisher."""
+        queue = self._queue
+        if queue is None:
+            raise RuntimeError("Event publisher not started. Call start() first.")
+        try:
+            queue.put_nowait((event, topic))
+        except asyncio.QueueFull:
+            # Backpressure: wait for the drain task instead of dropping the event
+            await queue.put((event, topic))
+
+    async def publish(self, event: DomainEvent, topic: str) -> None:
+        """Publish a domain event to a topic."""
+        await KafkaProducer.send(topic, self._prepare_message(event))
+        logger.debug("event_published", event_type=event.event_type, topic=topic)
+
+    async def publish_batch(self, events: list[tuple[DomainEvent, str]]) -> None:
+        """Publish multiple events in a batch, one producer batch per topic."""
+        by_topic: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for event, topic in events:
+            by_topic[topic].append(self._prepare_message(event))
+
+        for topic, messages in by_topic.items():
+            await KafkaProducer.send_batch(topic, messages)
+
+        logger.debug("event_batch_published", count=len(events))
+
+    @staticmethod
+    def _prepare_message(event: DomainEvent) -> dict[str, Any]:
+        """Convert a domain event into EVENT_SCHEMA message data."""
+        # Read fields directly; asdict() would deep-copy every value
+        payload = {name: getattr(event, name) for name in _payload_fields(type(event))}
+        return {
+            "event_id": str(event.event_id),
+            "event_type": event.event_type,
+            "timestamp": event.timestamp.isoformat(),
+            "payload": orjson.dumps(payload, default=str).decode(),
+        }
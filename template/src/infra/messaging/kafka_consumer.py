@@ -0,0 +1,216 @@
+"""Kafka consumer with Avro deserialization."""
+
+import asyncio
+import io
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import fastavro
+from aiokafka import AIOKafkaConsumer, TopicPartition
+
+from infra.logging import logger
+from infra.messaging.avro import parse_schema_cached
+from infra.messaging.schema_registry import SchemaRegistry
+from config import Settings
+
+# Confluent wire format: magic byte 0, 4-byte big-endian schema id, Avro body
+_WIRE_HEADER_SIZE = 5
+
+EventHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class KafkaConsumer:
+    """Kafka consumer manager."""
+
+    _consumer: AIOKafkaConsumer | None = None
+    _handlers: dict[str, EventHandler] = {}
+    _read_schema: Any = None
+    _use_schema_registry: bool = False
+    _running: bool = False
+    _auto_commit: bool = True
+    _batch_size: int = 500
+    _poll_timeout_ms: int = 500
+    _handler_concurrency: int = 100
+    _max_retries: int = 3
+    _retry_backoff_ms: int = 500
+
+    @classmethod
+    def register_handler(cls, topic: str, handler: EventHandler) -> None:
+        """Register an async handler for messages on a topic."""
+        cls._handlers[topic] = handler
+
+    @classmethod
+    async def start(cls, settings: Settings, schema: dict[str, Any]) -> None:
+        """
+        Create and start the Kafka consumer.
+
+        Args:
+            settings: Application settings
+            schema: Avro schema used to read message values
+        """
+        try:
+            cls._read_schema = parse_schema_cached(schema)
+            cls._use_schema_registry = settings.kafka.use_schema_registry
+            if cls._use_schema_registry:
+                await SchemaRegistry.connect(settings)
+            cls._auto_commit = settings.kafka.enable_auto_commit
+            cls._batch_size = settings.kafka.max_poll_records
+            cls._poll_timeout_ms = settings.kafka.poll_timeout_ms
+            cls._handler_concurrency = settings.kafka.handler_concurrency
+            cls._max_retries = settings.kafka.max_retries
+            cls._retry_backoff_ms = settings.kafka.retry_backoff_ms
+
+            cls._consumer = AIOKafkaConsumer(
+                *settings.kafka.topics,
+                bootstrap_servers=settings.kafka.bootstrap_servers,
+                group_id=settings.kafka.consumer_group,
+                auto_offset_reset=settings.kafka.auto_offset_reset,
+                enable_auto_commit=settings.kafka.enable_auto_commit,
+                max_poll_records=settings.kafka.max_poll_records,
+            )
+            await cls._consumer.start()
+
+            logger.info("kafka_consumer_started", topics=settings.kafka.topics)
+        except Exception as e:
+            logger.error("kafka_consumer_start_failed", error=str(e))
+            raise
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Stop consuming and leave the consumer group."""
+        cls._running = False
+        if cls._consumer:
+            await cls._consumer.stop()
+            logger.info("kafka_consumer_stopped")
+        if cls._use_schema_registry:
+            await SchemaRegistry.close()
+
+    @classmethod
+    def get_consumer(cls) -> AIOKafkaConsumer:
+        """Get Kafka consumer."""
+        if not cls._consumer:
+            raise RuntimeError("Kafka consumer not initialized. Call start() first.")
+        return cls._consumer
+
+    @classmethod
+    async def consume(cls) -> None:
+        """
+        Consume messages in batches until stop() is called.
+
+        Handlers for a batch run concurrently (bounded by handler_concurrency),
+        so they must not depend on message order. Offsets are committed once
+        per fetched batch (unless auto commit is enabled). In each partition
+        only the messages before the first failure are committed; the
+        partition is rewound to that message, so it and everything after it
+        are redelivered and handled again (handlers must be idempotent).
+
+        Redeliveries back off exponentially from retry_backoff_ms. A message
+        still failing after max_retries redeliveries (e.g. one that cannot be
+        deserialized) is logged as kafka_message_skipped and committed past,
+        so it cannot block its partition.
+        """
+        consumer = cls.get_consumer()
+        semaphore = asyncio.Semaphore(cls._handler_concurrency)
+        cls._running = True
+
+        # Bound once: the loop below runs for every fetched batch
+        handlers = cls._handlers
+        deserialize = cls._deserialize_avro
+        auto_commit = cls._auto_commit
+        poll_timeout_ms = cls._poll_timeout_ms
+        batch_size = cls._batch_size
+        max_retries = cls._max_retries
+        retry_backoff_ms = cls._retry_backoff_ms
+        # Per partition: (offset of the message being retried, failed attempts)
+        retries: dict[TopicPartition, tuple[int, int]] = {}
+
+        async def dispatch(handler: EventHandler, value: bytes) -> None:
+            async with semaphore:
+                await handler(await deserialize(value))
+
+        while cls._running:
+            batches = await consumer.getmany(
+                timeout_ms=poll_timeout_ms, max_records=batch_size
+            )
+            if not batches:
+                continue
+
+            dispatched = []
+            for tp, messages in batches.items():
+                handler = handlers.get(tp.topic)
+                if handler is None:
+                    logger.warning("kafka_handler_missing", topic=tp.topic)
+                    continue
+                dispatched.extend(
+                    (tp, msg, dispatch(handler, msg.value)) for msg in messages
+                )
+
+            results = await asyncio.gather(
+                *(coro for _, _, coro in dispatched), return_exceptions=True
+            )
+            # Offsets of the failed messages per partition, in offset order:
+            # messages within a partition are dispatched in that order
+            failed: dict[TopicPartition, list[int]] = {}
+            for (tp, msg, _), result in zip(dispatched, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "kafka_message_failed",
+                        topic=msg.topic,
+                        partition=msg.partition,
+                        offset=msg.offset,
+                        error=str(result),
+                    )
+                    failed.setdefault(tp, []).append(msg.offset)
+
+            if auto_commit:
+                continue
+
+            positions: dict[TopicPartition, int] = {}
+            backoff_ms = 0
+            for tp, messages in batches.items():
+                offsets = failed.get(tp)
+                retried_offset, retried = retries.get(tp, (-1, 0))
+                attempts = (
+                    retried + 1 if offsets and offsets[0] == retried_offset else 1
+                )
+                if offsets and attempts > max_retries:
+                    logger.error(
+                        "kafka_message_skipped",
+                        topic=tp.topic,
+                        partition=tp.partition,
+                        offset=offsets[0],
+                        attempts=attempts,
+                    )
+                    # Retry from the next failure, which has failed only once
+                    offsets, attempts = offsets[1:], 1
+                if not offsets:
+                    retries.pop(tp, None)
+                    positions[tp] = messages[-1].offset + 1
+                    continue
+
+                retries[tp] = (offsets[0], attempts)
+                positions[tp] = offsets[0]
+                consumer.seek(tp, offsets[0])
+                backoff_ms = max(backoff_ms, retry_backoff_ms * 2 ** (attempts - 1))
+
+            await consumer.commit(positions)
+            if backoff_ms:
+                await asyncio.sleep(backoff_ms / 1000)
+
+    @classmethod
+    async def _deserialize_avro(cls, value: bytes) -> dict[str, Any]:
+        """
+        Deserialize an Avro message value into the reader schema.
+
+        With the schema registry enabled, values use the Confluent wire format
+        and the writer schema is resolved (once) by its id.
+        """
+        # BytesIO shares the bytes buffer, so skipping the header copies nothing
+        buf = io.BytesIO(value)
+        if not cls._use_schema_registry:
+            return fastavro.schemaless_reader(buf, cls._read_schema)
+
+        schema_id = int.from_bytes(value[1:_WIRE_HEADER_SIZE], "big")
+        writer_schema = await SchemaRegistry.get_schema(schema_id)
+        buf.seek(_WIRE_HEADER_SIZE)
+        return fastavro.schemaless_reader(buf, writer_schema, cls._read_schema)
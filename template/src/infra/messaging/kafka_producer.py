@@ -0,0 +1,161 @@
+"""Kafka producer with Avro serialization."""
+
+import asyncio
+import io
+import random
+import threading
+from typing import Any
+
+import fastavro
+from aiokafka import AIOKafkaProducer
+
+from infra.logging import logger
+from infra.messaging.avro import parse_schema_cached
+from config import Settings
+
+# Optional message key naming a registered schema; popped before serializing
+SCHEMA_NAME_KEY = "__schema_name__"
+
+# Producer batches awaiting delivery at once within send_batch()
+MAX_INFLIGHT_BATCHES = 8
+
+
+class KafkaProducer:
+    """Kafka producer manager."""
+
+    _producer: AIOKafkaProducer | None = None
+    _schemas: dict[str, Any] = {}
+    _default_schema: Any = None
+    # Per-thread serialization buffer, reused across messages
+    _buf_tls = threading.local()
+
+    @classmethod
+    def register_schema(cls, schema: dict[str, Any], default: bool = False) -> None:
+        """
+        Parse and register an Avro schema under its full name.
+
+        Args:
+            schema: Avro record schema
+            default: Use it for messages without a schema name
+        """
+        parsed = parse_schema_cached(schema)
+        cls._schemas[parsed["name"]] = parsed
+        if default or cls._default_schema is None:
+            cls._default_schema = parsed
+
+    @classmethod
+    async def start(cls, settings: Settings) -> None:
+        """Create and start the Kafka producer."""
+        try:
+            cls._producer = AIOKafkaProducer(
+                bootstrap_servers=settings.kafka.bootstrap_servers,
+                compression_type=settings.kafka.compression_type,
+                linger_ms=settings.kafka.linger_ms,
+                acks=settings.kafka.acks,
+                max_batch_size=settings.kafka.max_batch_size,
+                value_serializer=cls._serialize_avro,
+            )
+            await cls._producer.start()
+
+            logger.info(
+                "kafka_producer_started",
+                bootstrap_servers=settings.kafka.bootstrap_servers,
+            )
+        except Exception as e:
+            # Leave no half-started producer behind for send() or stop() to use
+            cls._producer = None
+            logger.error("kafka_producer_start_failed", error=str(e))
+            raise
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Flush pending messages and stop the producer."""
+        if cls._producer:
+            producer, cls._producer = cls._producer, None
+            await producer.stop()
+            logger.info("kafka_producer_stopped")
+
+    @classmethod
+    def is_started(cls) -> bool:
+        """Whether start() has succeeded since the last failure or stop()."""
+        return cls._producer is not None
+
+    @classmethod
+    def get_producer(cls) -> AIOKafkaProducer:
+        """Get Kafka producer."""
+        if not cls._producer:
+            raise RuntimeError("Kafka producer not initialized. Call start() first.")
+        return cls._producer
+
+    @classmethod
+    async def send(cls, topic: str, value: dict[str, Any]) -> None:
+        """
+        Send a single message and wait for the broker acknowledgement.
+
+        Args:
+            topic: Target topic name
+            value: Message data
+        """
+        await cls.get_producer().send_and_wait(topic, value=value)
+
+    @classmethod
+    async def send_batch(cls, topic: str, values: list[dict[str, Any]]) -> None:
+        """
+        Send messages to a topic using producer batches.
+
+        Full batches are handed to the producer without waiting for their
+        delivery, so serialization overlaps with network sends; at most
+        MAX_INFLIGHT_BATCHES are outstanding. Returns once all are delivered.
+
+        Args:
+            topic: Target topic name
+            values: Message data
+        """
+        producer = cls.get_producer()
+        partitions = tuple(await producer.partitions_for(topic))
+        inflight: set[asyncio.Future] = set()
+
+        async def ship(batch) -> None:
+            if len(inflight) >= MAX_INFLIGHT_BATCHES:
+                done, _ = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED
+                )
+                inflight.difference_update(done)
+                for future in done:
+                    future.result()  # surface delivery errors early
+            inflight.add(
+                await producer.send_batch(
+                    batch, topic, partition=random.choice(partitions)
+                )
+            )
+
+        batch = producer.create_batch()
+        for value in values:
+            serialized = cls._serialize_avro(value)
+            if batch.append(key=None, value=serialized, timestamp=None) is None:
+                # Batch is full: ship it and retry the message on a fresh one
+                await ship(batch)
+                batch = producer.create_batch()
+                if batch.append(key=None, value=serialized, timestamp=None) is None:
+                    raise ValueError(
+                        f"Message of {len(serialized)} bytes exceeds max_batch_size"
+                    )
+
+        if batch.record_count():
+            await ship(batch)
+
+        await asyncio.gather(*inflight)
+
+    @classmethod
+    def _serialize_avro(cls, value: dict[str, Any]) -> bytes:
+        """Serialize message data with a registered, already parsed schema."""
+        schema_name = value.pop(SCHEMA_NAME_KEY, None)
+        schema = cls._schemas[schema_name] if schema_name else cls._default_schema
+
+        buf = getattr(cls._buf_tls, "buf", None)
+        if buf is None:
+            buf = cls._buf_tls.buf = io.BytesIO()
+        buf.seek(0)
+        fastavro.schemaless_writer(buf, schema, value)
+        buf.truncate()  # drop leftovers from a longer previous message
+        return buf.getvalue()
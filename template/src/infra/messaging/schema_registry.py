@@ -0,0 +1,56 @@
+"""Schema Registry client for resolving Avro writer schemas."""
+
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+import orjson
+
+from infra.logging import logger
+from infra.messaging.avro import SCHEMA_CACHE_SIZE, parse_schema_cached
+from config import Settings
+
+
+class SchemaRegistry:
+    """Confluent Schema Registry client with a parsed-schema cache."""
+
+    _client: httpx.AsyncClient | None = None
+    _schema_cache: OrderedDict[int, Any] = OrderedDict()
+
+    @classmethod
+    async def connect(cls, settings: Settings) -> None:
+        """Create the HTTP client for the registry."""
+        cls._client = httpx.AsyncClient(base_url=settings.kafka.schema_registry_url)
+        logger.info("schema_registry_connected", url=settings.kafka.schema_registry_url)
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the HTTP client."""
+        if cls._client:
+            await cls._client.aclose()
+            logger.info("schema_registry_disconnected")
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Get registry HTTP client."""
+        if not cls._client:
+            raise RuntimeError("Schema registry not initialized. Call connect() first.")
+        return cls._client
+
+    @classmethod
+    async def get_schema(cls, schema_id: int) -> Any:
+        """Get the parsed Avro schema registered under schema_id."""
+        schema = cls._schema_cache.get(schema_id)
+        if schema is not None:
+            cls._schema_cache.move_to_end(schema_id)
+            return schema
+
+        response = await cls.get_client().get(f"/schemas/ids/{schema_id}")
+        response.raise_for_status()
+        # Ids registered for identical schemas share one parsed schema
+        schema = parse_schema_cached(orjson.loads(response.json()["schema"]))
+
+        cls._schema_cache[schema_id] = schema
+        if len(cls._schema_cache) > SCHEMA_CACHE_SIZE:
+            cls._schema_cache.popitem(last=False)
+        return schema
@@ -0,0 +1,17 @@
+"""Shared fixtures for integration tests."""
+
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from src import app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """HTTP client bound to the app, shared by all tests in a module."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
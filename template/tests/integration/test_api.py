@@ -3,67 +3,60 @@
 import pytest
 from httpx import AsyncClient
 
-from src import app
+# Run in the module-scoped loop that owns the shared client fixture
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest.mark.asyncio
-async def test_health_check():
+async def test_health_check(client: AsyncClient):
     """Test health check endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/health")
+    response = await client.get("/health")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
 
 
-@pytest.mark.asyncio
-async def test_create_example():
+async def test_create_example(client: AsyncClient):
     """Test creating an example."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/api/v1/examples/",
-            json={
-                "name": "Test Example",
-                "email": "test@example.com",
-            },
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Test Example"
-        assert data["email"] == "test@example.com"
-        assert "id" in data
-
-
-@pytest.mark.asyncio
-async def test_get_example():
+    response = await client.post(
+        "/api/v1/examples/",
+        json={
+            "name": "Test Example",
+            "email": "test@example.com",
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["name"] == "Test Example"
+    assert data["email"] == "test@example.com"
+    assert "id" in data
+
+
+async def test_get_example(client: AsyncClient):
     """Test getting an example."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        # Create example first
-        create_response = await client.post(
-            "/api/v1/examples/",
-            json={
-                "name": "Test Example",
-                "email": "test2@example.com",
-            },
-        )
-        example_id = create_response.json()["id"]
+    # Create example first
+    create_response = await client.post(
+        "/api/v1/examples/",
+        json={
+            "name": "Test Example",
+            "email": "test2@example.com",
+        },
+    )
+    example_id = create_response.json()["id"]
 
-        # Get example
-        response = await client.get(f"/api/v1/examples/{example_id}")
+    # Get example
+    response = await client.get(f"/api/v1/examples/{example_id}")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == example_id
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == example_id
 
 
-@pytest.mark.asyncio
-async def test_list_examples():
+async def test_list_examples(client: AsyncClient):
     """Test listing examples."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/v1/examples/")
+    response = await client.get("/api/v1/examples/")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
@@ -0,0 +1,91 @@
+"""Unit tests for the correlation ID middleware."""
+
+from api.middleware.correlation_id import CorrelationIdMiddleware
+from infra.logging import correlation_id_var
+
+
+def make_app(response_headers=None):
+    """App recording the correlation ID it sees, and replying with headers."""
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["state"] = scope.get("state", {}).get("correlation_id")
+        seen["context"] = correlation_id_var.get()
+        start = {"type": "http.response.start", "status": 200}
+        if response_headers is not None:
+            start["headers"] = response_headers
+        await send(start)
+        await send({"type": "http.response.body", "body": b""})
+
+    return CorrelationIdMiddleware(app), seen
+
+
+async def call(app, path="/examples", headers=(), scope_type="http"):
+    """Send one request through app; return the response start message."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": scope_type, "path": path, "headers": list(headers)}
+    await app(scope, receive, send)
+    return messages[0] if messages else None
+
+
+async def test_generates_correlation_id():
+    """Test a request without the header gets a new id, echoed in the response."""
+    app, seen = make_app()
+
+    start = await call(app)
+
+    correlation_id = dict(start["headers"])[b"x-correlation-id"].decode()
+    assert len(bytes.fromhex(correlation_id)) == 16
+    assert seen == {"state": correlation_id, "context": correlation_id}
+
+
+async def test_reuses_incoming_correlation_id():
+    """Test an incoming id is used for the request and returned unchanged."""
+    app, seen = make_app(response_headers=[(b"content-type", b"text/plain")])
+
+    start = await call(app, headers=[(b"x-correlation-id", b"abc-123")])
+
+    assert start["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"x-correlation-id", b"abc-123"),
+    ]
+    assert seen == {"state": "abc-123", "context": "abc-123"}
+
+
+async def test_immutable_response_headers_are_replaced():
+    """Test headers sent as a tuple get the id appended on a new list."""
+    app, _ = make_app(response_headers=((b"content-type", b"text/plain"),))
+
+    start = await call(app, headers=[(b"x-correlation-id", b"abc-123")])
+
+    assert start["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"x-correlation-id", b"abc-123"),
+    ]
+
+
+async def test_context_is_reset_after_request():
+    """Test the correlation ID does not leak past the request."""
+    app, _ = make_app()
+    before = correlation_id_var.get()
+
+    await call(app)
+
+    assert correlation_id_var.get() == before
+
+
+async def test_bypass_path_is_untouched():
+    """Test probe paths get no correlation ID."""
+    app, seen = make_app()
+
+    start = await call(app, path="/health")
+
+    assert "headers" not in start
+    assert seen["state"] is None
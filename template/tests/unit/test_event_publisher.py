@@ -0,0 +1,45 @@
+"""Unit tests for the background Kafka event publisher."""
+
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("aiokafka")
+
+from application.domain.events.example_events import ExampleCreatedEvent  # noqa: E402
+from config import get_settings  # noqa: E402
+from infra.messaging import KafkaEventPublisher, KafkaProducer  # noqa: E402
+
+
+async def test_producer_started_after_broker_recovers(monkeypatch):
+    """Test a producer that failed to start is started again for later batches."""
+    starts = iter([ConnectionError("broker unreachable"), None])
+    sent = []
+
+    async def start(settings):
+        error = next(starts)
+        if error:
+            raise error
+        monkeypatch.setattr(KafkaProducer, "_producer", object())
+
+    async def send_batch(topic, messages):
+        sent.extend(messages)
+
+    monkeypatch.setattr(KafkaProducer, "_producer", None)
+    monkeypatch.setattr(KafkaProducer, "start", start)
+    monkeypatch.setattr(KafkaProducer, "send_batch", send_batch)
+
+    await KafkaEventPublisher.start(get_settings())
+    publisher = KafkaEventPublisher()
+    try:
+        for _ in range(2):
+            event = ExampleCreatedEvent(
+                example_id=uuid4(), name="Test", email="test@example.com"
+            )
+            await publisher.enqueue(event, "events")
+            await KafkaEventPublisher._queue.join()
+    finally:
+        await KafkaEventPublisher.stop()
+
+    # The first batch is lost to the outage; the second goes out
+    assert len(sent) == 1
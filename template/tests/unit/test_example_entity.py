@@ -1,6 +1,8 @@
 """Unit tests for domain entities."""
 
-from src.application.domain.entities.example import ExampleEntity
+from datetime import datetime, UTC
+
+from application.domain.entities.example import ExampleEntity
 
 
 def test_entity_creation():
@@ -12,6 +14,20 @@ def test_entity_creation():
     assert entity.is_active is True
 
 
+def test_entity_creation_timestamps():
+    """Test new entities start with matching timestamps."""
+    entity = ExampleEntity(name="Test", email="test@example.com")
+
+    assert entity.updated_at == entity.created_at
+
+
+def test_entity_has_no_instance_dict():
+    """Test entities use slots instead of a per-instance __dict__."""
+    entity = ExampleEntity(name="Test", email="test@example.com")
+
+    assert not hasattr(entity, "__dict__")
+
+
 def test_entity_activate():
     """Test entity activation."""
     entity = ExampleEntity(name="Test", email="test@example.com", is_active=False)
@@ -39,6 +55,18 @@ def test_entity_update_name():
     assert entity.name == "Updated"
 
 
+def test_entity_mutations_use_given_time():
+    """Test batch callers can share one timestamp across mutations."""
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    entity = ExampleEntity(name="Test", email="test@example.com")
+
+    entity.deactivate(now=now)
+    assert entity.updated_at == now
+
+    entity.update_name("Updated", now=now)
+    assert entity.updated_at == now
+
+
 def test_entity_update_name_empty():
     """Test entity name update with empty value."""
     entity = ExampleEntity(name="Test", email="test@example.com")
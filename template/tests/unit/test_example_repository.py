@@ -0,0 +1,110 @@
+"""Unit tests for the example repository port and its Beanie implementation."""
+
+from datetime import datetime, timedelta, UTC
+from operator import itemgetter
+from uuid import uuid4
+
+import pytest
+from mongomock.filtering import filter_applies
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from application.domain.entities.example import ExampleEntity
+from application.ports.repositories.example_repository import (
+    DuplicateEmailsError,
+    ExampleRepository,
+)
+from infra.database.models import LIST_ORDER, ExampleDocument
+from infra.database.repositories.example_repository import (
+    BeanieExampleRepository,
+    _after_cursor,
+)
+
+
+def test_repository_modules_import():
+    """Test the port and its implementation are importable."""
+    assert issubclass(BeanieExampleRepository, ExampleRepository)
+
+
+def test_beanie_repository_implements_port():
+    """Test the Beanie repository implements every port method."""
+    assert not BeanieExampleRepository.__abstractmethods__
+
+
+async def test_create_duplicate_email_raises_value_error(monkeypatch):
+    """Test a unique index violation surfaces as the use case's ValueError."""
+
+    class DuplicateDocument:
+        async def insert(self):
+            raise DuplicateKeyError("E11000 duplicate key error")
+
+    repository = BeanieExampleRepository()
+    monkeypatch.setattr(repository, "_to_document", lambda _: DuplicateDocument())
+
+    with pytest.raises(ValueError, match="already exists"):
+        await repository.create(ExampleEntity(name="Test", email="test@example.com"))
+
+
+def failing_bulk_repository(monkeypatch, *write_errors):
+    """Repository whose insert_many fails with the given bulk write errors."""
+
+    async def insert_many(documents, ordered):
+        raise BulkWriteError({"writeErrors": list(write_errors), "nInserted": 0})
+
+    monkeypatch.setattr(ExampleDocument, "insert_many", insert_many)
+    repository = BeanieExampleRepository()
+    monkeypatch.setattr(repository, "_to_document", lambda entity: entity)
+    return repository
+
+
+async def test_bulk_create_duplicates_raise_with_created_entities(monkeypatch):
+    """Test duplicate emails raise a ValueError holding only the inserted entities."""
+    repository = failing_bulk_repository(
+        monkeypatch, {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key"}
+    )
+    entities = [
+        ExampleEntity(name="Test", email=f"test{n}@example.com") for n in range(3)
+    ]
+
+    with pytest.raises(DuplicateEmailsError, match="test1@example.com") as exc_info:
+        await repository.bulk_create(entities)
+
+    assert isinstance(exc_info.value, ValueError)
+    assert exc_info.value.emails == ["test1@example.com"]
+    assert exc_info.value.created == [entities[0], entities[2]]
+
+
+async def test_bulk_create_other_write_errors_propagate(monkeypatch):
+    """Test write errors other than duplicates are not reported as duplicates."""
+    repository = failing_bulk_repository(
+        monkeypatch,
+        {"index": 0, "code": 11000, "errmsg": "E11000 duplicate key"},
+        {"index": 1, "code": 121, "errmsg": "Document failed validation"},
+    )
+    entities = [
+        ExampleEntity(name="Test", email=f"test{n}@example.com") for n in range(2)
+    ]
+
+    with pytest.raises(BulkWriteError):
+        await repository.bulk_create(entities)
+
+
+def test_cursor_pages_through_created_at_ties():
+    """Test keyset paging returns every example once when created_at ties."""
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    # Groups of five examples share a created_at, as one bulk_create batch may
+    documents = [
+        {"_id": uuid4(), "created_at": start + timedelta(seconds=n // 5)}
+        for n in range(12)
+    ]
+    ordered = documents.copy()
+    for key, direction in reversed(LIST_ORDER):
+        ordered.sort(key=itemgetter(key), reverse=direction < 0)
+
+    seen, cursor = [], None
+    while page := [
+        d for d in ordered if not cursor or filter_applies(_after_cursor(cursor), d)
+    ][:3]:
+        seen.extend(page)
+        cursor = (page[-1]["created_at"], page[-1]["_id"])
+
+    assert seen == ordered
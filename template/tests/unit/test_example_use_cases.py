@@ -0,0 +1,128 @@
+"""Unit tests for the example use cases."""
+
+from typing import Any
+
+import pytest
+
+from application.dto.example_dto import CreateExampleDTO
+from application.use_cases.example_use_cases import (
+    BulkDeleteExamplesUseCase,
+    CreateExampleUseCase,
+    DeleteExampleUseCase,
+)
+
+
+class InMemoryRepository:
+    """The repository methods the use cases call, backed by a dict."""
+
+    def __init__(self):
+        self.entities = {}
+
+    async def create(self, entity):
+        if await self.get_by_email(entity.email):
+            raise ValueError(f"Email {entity.email} already exists")
+        self.entities[entity.id] = entity
+        return entity
+
+    async def get_by_id(self, entity_id):
+        return self.entities.get(entity_id)
+
+    async def get_by_ids(self, entity_ids):
+        return [self.entities[i] for i in entity_ids if i in self.entities]
+
+    async def get_by_email(self, email):
+        return next((e for e in self.entities.values() if e.email == email), None)
+
+    async def delete(self, entity_id):
+        return self.entities.pop(entity_id, None) is not None
+
+    async def bulk_delete(self, entity_ids):
+        return sum([await self.delete(i) for i in entity_ids])
+
+
+class DictCache:
+    """Cache backed by a dict, ignoring TTLs."""
+
+    def __init__(self):
+        self.values: dict[str, Any] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+class BrokenCache:
+    """Cache whose backend is down."""
+
+    async def get(self, key):
+        raise ConnectionError("cache down")
+
+    async def set(self, key, value, ttl=None):
+        raise ConnectionError("cache down")
+
+    async def delete(self, key):
+        raise ConnectionError("cache down")
+
+
+class StoppedPublisher:
+    """Event publisher whose background task was never started."""
+
+    async def enqueue(self, event, topic):
+        raise RuntimeError("Event publisher not started. Call start() first.")
+
+
+def make_dto(email: str = "test@example.com") -> CreateExampleDTO:
+    return CreateExampleDTO(name="Test", email=email)
+
+
+@pytest.mark.parametrize("cache", [None, BrokenCache()])
+async def test_create_checks_repository_without_working_cache(cache):
+    """Test email checks fall back to the repository when the cache is absent or down."""
+    use_case = CreateExampleUseCase(InMemoryRepository(), cache=cache)
+
+    created = await use_case.execute(make_dto())
+    assert created.email == "test@example.com"
+
+    with pytest.raises(ValueError, match="already exists"):
+        await use_case.execute(make_dto())
+
+
+async def test_create_succeeds_when_event_cannot_be_queued():
+    """Test a saved example is returned even if its event fails to queue."""
+    repository = InMemoryRepository()
+    use_case = CreateExampleUseCase(
+        repository, event_publisher=StoppedPublisher(), event_topic="events"
+    )
+
+    created = await use_case.execute(make_dto())
+
+    assert created.id in repository.entities
+
+
+async def test_delete_frees_cached_email():
+    """Test deleting an example clears its cached email check."""
+    repository, cache = InMemoryRepository(), DictCache()
+    create = CreateExampleUseCase(repository, cache=cache)
+    created = await create.execute(make_dto())
+    assert cache.values == {"email_exists:test@example.com": True}
+
+    assert await DeleteExampleUseCase(repository, cache=cache).execute(created.id)
+
+    assert cache.values == {}
+    await create.execute(make_dto())
+
+
+async def test_bulk_delete_frees_cached_emails():
+    """Test bulk deletion clears the cached email check of each deleted example."""
+    repository, cache = InMemoryRepository(), DictCache()
+    create = CreateExampleUseCase(repository, cache=cache)
+    ids = [(await create.execute(make_dto(f"{n}@example.com"))).id for n in "ab"]
+
+    assert await BulkDeleteExamplesUseCase(repository, cache=cache).execute(ids) == 2
+
+    assert cache.values == {}
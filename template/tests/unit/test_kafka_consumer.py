@@ -0,0 +1,96 @@
+"""Unit tests for the Kafka consumer's commit and retry handling."""
+
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+pytest.importorskip("aiokafka")
+
+from aiokafka import TopicPartition  # noqa: E402
+
+from infra.messaging.kafka_consumer import KafkaConsumer  # noqa: E402
+
+TP = TopicPartition("events", 0)
+
+
+class FakeConsumer:
+    """One-partition log with seek/commit, stopping the loop once drained."""
+
+    def __init__(self, values: list[dict]):
+        self.log = [
+            SimpleNamespace(
+                topic=TP.topic, partition=TP.partition, offset=n, value=orjson.dumps(v)
+            )
+            for n, v in enumerate(values)
+        ]
+        self.position = 0
+        self.commits: list[dict[TopicPartition, int]] = []
+
+    async def getmany(self, timeout_ms, max_records):
+        messages = self.log[self.position : self.position + max_records]
+        self.position += len(messages)
+        if self.position == len(self.log):
+            KafkaConsumer._running = False
+        return {TP: messages} if messages else {}
+
+    def seek(self, tp, offset):
+        self.position = offset
+        KafkaConsumer._running = True
+
+    async def commit(self, offsets):
+        self.commits.append(offsets)
+
+
+@pytest.fixture
+def consumer(monkeypatch):
+    async def deserialize(value):
+        return orjson.loads(value)
+
+    monkeypatch.setattr(KafkaConsumer, "_deserialize_avro", deserialize)
+    monkeypatch.setattr(KafkaConsumer, "_auto_commit", False)
+    monkeypatch.setattr(KafkaConsumer, "_max_retries", 2)
+    monkeypatch.setattr(KafkaConsumer, "_retry_backoff_ms", 0)
+    monkeypatch.setattr(KafkaConsumer, "_handlers", {})
+
+    def use(values):
+        fake = FakeConsumer(values)
+        monkeypatch.setattr(KafkaConsumer, "_consumer", fake)
+        return fake
+
+    return use
+
+
+async def test_poison_message_is_skipped_after_max_retries(consumer):
+    """Test a message that always fails is retried, then committed past."""
+    fake = consumer([{"ok": True}, {"ok": False}, {"ok": True}])
+    poison_deliveries = 0
+
+    async def handler(message):
+        nonlocal poison_deliveries
+        if not message["ok"]:
+            poison_deliveries += 1
+            raise ValueError("poison")
+
+    KafkaConsumer.register_handler(TP.topic, handler)
+    await KafkaConsumer.consume()
+
+    # One delivery plus max_retries redeliveries, then past the poison message
+    assert poison_deliveries == 3
+    assert fake.commits == [{TP: 1}, {TP: 1}, {TP: 3}]
+
+
+async def test_transient_failure_is_redelivered(consumer):
+    """Test a message that fails once is handled on redelivery."""
+    fake = consumer([{"ok": True}, {"ok": True}])
+    failures = iter([ValueError("transient")])
+
+    async def handler(message):
+        error = next(failures, None)
+        if error:
+            raise error
+
+    KafkaConsumer.register_handler(TP.topic, handler)
+    await KafkaConsumer.consume()
+
+    assert fake.commits == [{TP: 0}, {TP: 2}]
@@ -0,0 +1,177 @@
+"""Unit tests for the rate limiting middleware, against an in-memory Redis."""
+
+import time
+from collections import OrderedDict
+
+import orjson
+import pytest
+
+pytest.importorskip("redis")
+fakeredis = pytest.importorskip("fakeredis")
+
+from api.middleware import rate_limit  # noqa: E402
+from api.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
+from infra.cache import RedisManager  # noqa: E402
+from infra.cache.redis_manager import RATE_LIMIT_SCRIPT  # noqa: E402
+
+# Frozen at the start of a rate limit window (Retry-After is the full window)
+NOW = 60.0 * 28_333_333
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def request(app, client_ip: str = "10.0.0.1", path: str = "/examples"):
+    """Send one HTTP request through app; return the response start message."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [],
+        "client": (client_ip, 12345),
+    }
+    await app(scope, receive, send)
+    return messages[0]
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """RateLimitMiddleware allowing 60 requests per minute, synced every 6."""
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(RedisManager, "client", client, raising=False)
+    monkeypatch.setattr(
+        RedisManager,
+        "rate_limit_script",
+        client.register_script(RATE_LIMIT_SCRIPT),
+        raising=False,
+    )
+    monkeypatch.setattr(RedisManager, "rate_key_prefix", b"test:rate:")
+    monkeypatch.setattr(time, "time", lambda: NOW)
+
+    monkeypatch.setattr(rate_limit, "_RL_ENABLED", True)
+    monkeypatch.setattr(rate_limit, "_RL_LIMIT", 60)
+    monkeypatch.setattr(rate_limit, "_RL_WINDOW_MS", 60_000)
+    monkeypatch.setattr(rate_limit, "_RL_SYNC_EVERY", 6)
+    monkeypatch.setattr(rate_limit, "_local_hits", OrderedDict())
+    return RateLimitMiddleware(ok_app)
+
+
+async def test_batched_hits_overshoot_limit_by_less_than_a_batch(limiter):
+    """Test a client is admitted up to limit + sync batch - 1 requests, then blocked."""
+    statuses = [(await request(limiter))["status"] for _ in range(80)]
+
+    # Hits 61-65 are counted locally; the sync on hit 66 reports the overshoot
+    assert statuses.count(200) == 65
+    assert statuses == [200] * 65 + [429] * 15
+
+
+async def test_blocked_client_gets_retry_after(limiter):
+    """Test a blocked client is told when its window ends."""
+    for _ in range(66):
+        response = await request(limiter)
+
+    assert response["status"] == 429
+    assert (b"retry-after", b"60") in response["headers"]
+
+
+async def test_other_clients_are_counted_separately(limiter):
+    """Test one client's hits do not count against another."""
+    for _ in range(66):
+        await request(limiter, client_ip="10.0.0.1")
+
+    assert (await request(limiter, client_ip="10.0.0.2"))["status"] == 200
+
+
+async def test_eviction_keeps_recently_seen_blocked_client(limiter, monkeypatch):
+    """Test new clients at capacity evict the least recently seen one only."""
+    monkeypatch.setattr(rate_limit, "_RL_MAX_CLIENTS", 2)
+    for _ in range(66):
+        await request(limiter, client_ip="10.0.0.1")
+    await request(limiter, client_ip="10.0.0.2")
+    # Blocked and seen again, so 10.0.0.2 is now the least recently seen
+    assert (await request(limiter, client_ip="10.0.0.1"))["status"] == 429
+
+    await request(limiter, client_ip="10.0.0.3")
+
+    assert list(rate_limit._local_hits) == ["10.0.0.1", "10.0.0.3"]
+    assert (await request(limiter, client_ip="10.0.0.1"))["status"] == 429
+
+
+async def test_non_http_scopes_pass_through(limiter):
+    """Test lifespan and websocket scopes are not rate limited."""
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    middleware = RateLimitMiddleware(app)
+    for scope_type in ("lifespan", "websocket"):
+        await middleware({"type": scope_type, "path": "/"}, None, None)
+
+    assert seen == ["lifespan", "websocket"]
+    assert not rate_limit._local_hits
+
+
+@pytest.mark.parametrize("path", ["/health", "/docs", "/openapi.json"])
+async def test_bypass_paths_are_not_counted(limiter, path):
+    """Test probe and documentation paths skip rate limiting."""
+    for _ in range(80):
+        assert (await request(limiter, path=path))["status"] == 200
+
+    assert not rate_limit._local_hits
+
+
+async def test_disabled_rate_limiter_admits_everything(limiter, monkeypatch):
+    """Test no request is limited when rate limiting is disabled."""
+    monkeypatch.setattr(rate_limit, "_RL_ENABLED", False)
+
+    statuses = {(await request(limiter))["status"] for _ in range(80)}
+
+    assert statuses == {200}
+
+
+async def test_redis_errors_fail_open(limiter, monkeypatch):
+    """Test requests are admitted while Redis is unavailable."""
+
+    async def unavailable(**kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(RedisManager, "check_rate_limit", unavailable)
+
+    statuses = {(await request(limiter))["status"] for _ in range(80)}
+
+    assert statuses == {200}
+
+
+async def test_429_response_is_complete_json(limiter):
+    """Test the precomputed 429 reply is valid JSON with matching headers."""
+    for _ in range(66):
+        await request(limiter)
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "path": "/examples", "client": ("10.0.0.1", 1)}
+    await limiter(scope, None, send)
+    start, body = messages
+
+    headers = dict(start["headers"])
+    assert start["status"] == 429
+    assert headers[b"content-type"] == b"application/json"
+    assert int(headers[b"content-length"]) == len(body["body"])
+    assert orjson.loads(body["body"]) == {
+        "detail": "Rate limit exceeded. Please try again later."
+    }
+    # Retry-After is added per response, never to the shared header list
+    assert b"retry-after" not in dict(rate_limit._RL_HEADERS)